@@ -2,11 +2,16 @@
 from fastapi import APIRouter, Query, HTTPException, Request, Body
 from app.services.naming_service import NamingService
 from app.services.maab_validator import MaabValidator
+from app.services.data_registry import registry
+from app.services import json_store
+from app.services.result_cache import ResultCache
+from app.services.template_compiler import NameLengthError
 import os
 import json
 from pydantic import BaseModel
 from typing import Dict, List, Optional
-from fastapi.responses import FileResponse,JSONResponse
+from fastapi.responses import FileResponse,JSONResponse,StreamingResponse
+from fastapi.concurrency import run_in_threadpool
 # Request Models
 # -----------------------------
 class AbsVariableInput(BaseModel):
@@ -24,21 +29,31 @@ class NameInput(BaseModel):
 # -----------------------------
 router = APIRouter()
 
+# Results of identical generate/validate requests, keyed by the data versions they used
+generation_cache = ResultCache(maxsize=1024)
+validation_cache = ResultCache(maxsize=4096)
+
 # -----------------------------
 # Helpers
 # -----------------------------
-def load_json(path: str):
-    if os.path.exists(path):
-        with open(path, "r") as f:
-            try:
-                return json.load(f)
-            except json.JSONDecodeError:
-                return {}
-    return {}
-
-def save_json(path: str, data: dict):
-    with open(path, "w") as f:
-        json.dump(data, f, indent=4)
+def load_validator(component: Optional[str]):
+    if component is None:
+        return None
+    try:
+        return MaabValidator(component)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail=f"No rules found for component '{component}'")
+
+def generation_data_version(format: str, standard: str, component: Optional[str]):
+    """Versions of every index a generated name depends on."""
+    keys = [
+        f"naming_conventions/{format}",
+        f"standards/{standard}/abbreviation",
+        f"standards/{standard}/strategy",
+    ]
+    if component is not None:
+        keys.append(f"maab/rules/{component}")
+    return tuple(registry.version(k) for k in keys)
 
 # -----------------------------
 # Formats & Standards
@@ -66,6 +81,11 @@ def get_standards():
         return {"standards": []}
     return {"standards": os.listdir(base_path)}
 
+@router.get("/data-versions")
+def get_data_versions():
+    """Return the version of every loaded convention, abbreviation and rule index."""
+    return registry.versions()
+
 @router.get("/fields/{format}")
 def get_format_fields(format: str):
     base_path = os.path.join(os.getcwd(), f"data/naming_conventions/{format}")
@@ -102,26 +122,103 @@ def get_format_fields(format: str):
 # Variable Name Generation
 # -----------------------------
 @router.post("/generate-variable-name/{format}/{standard}")
-async def gen_var_name(format: str, standard: str, request: Request):
+async def gen_var_name(
+    format: str,
+    standard: str,
+    request: Request,
+    max_length: Optional[int] = Query(None, ge=1),
+    component: Optional[str] = Query(None)
+):
+    """
+    Generate a variable name. With max_length the description is shortened to fit;
+    with component the name is also validated against that component's MAAB rules,
+    whose max_length applies when none is given.
+    """
     try:
         user_data = await request.json()
     except Exception:
         raise HTTPException(status_code=400, detail="Invalid input format. Must be JSON.")
-
-    service = NamingService(format=format, standard=standard)
-
+    if not isinstance(user_data, dict):
+        raise HTTPException(status_code=400, detail="Invalid input format. Must be a JSON object.")
+
+    computed = False
+
+    def generate():
+        nonlocal computed
+        computed = True
+        budget = max_length
+        validator = load_validator(component)
+        if budget is None and validator is not None:
+            budget = validator.max_length()
+
+        service = NamingService(format=format, standard=standard)
+
+        try:
+            variable_name = service.gen_var_name(max_length=budget, user_data=user_data, record=True)
+        except KeyError as e:
+            raise HTTPException(status_code=422, detail=f"Missing required field: {e}")
+        except NameLengthError as e:
+            raise HTTPException(status_code=422, detail=str(e))
+
+        response = {"variable_name": variable_name, "status": "pending"}
+        if validator is not None:
+            response["validation"] = {"component": component, "results": validator.validate(variable_name)}
+        return response
+
+    # Identical requests against the same data share one result
+    key = (
+        format, standard, json.dumps(user_data, sort_keys=True), max_length, component,
+        generation_data_version(format, standard, component)
+    )
+    response = await run_in_threadpool(generation_cache.get_or_compute, key, generate)
+
+    if not computed:
+        # A cached name is still recorded, as pending.json may have been cleared since
+        pending_path = os.path.join(os.getcwd(), f"data/standards/{standard}/pending.json")
+        await run_in_threadpool(
+            json_store.update, pending_path, {response["variable_name"]: user_data.get("description", "")}
+        )
+    return response
+
+
+@router.post("/generate-variable-names/{format}/{standard}")
+async def gen_var_names(
+    format: str,
+    standard: str,
+    request: Request,
+    max_length: Optional[int] = Query(None, ge=1),
+    component: Optional[str] = Query(None)
+):
+    """Generate names for a list of inputs; each distinct word is abbreviated once per batch."""
     try:
-        variable_name = service.gen_var_name(**user_data)
-    except KeyError as e:
-        raise HTTPException(status_code=422, detail=f"Missing required field: {e}")
-
-    # Save to pending.json for this standard
-    pending_path = os.path.join(os.getcwd(), f"data/standards/{standard}/pending.json")
-    pending = load_json(pending_path)
-    pending[variable_name] = user_data.get("description", "")
-    save_json(pending_path, pending)
+        items = await request.json()
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid input format. Must be JSON.")
+    if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+        raise HTTPException(status_code=400, detail="Invalid input format. Must be a JSON list of objects.")
+
+    def generate():
+        budget = max_length
+        validator = load_validator(component)
+        if budget is None and validator is not None:
+            budget = validator.max_length()
+
+        service = NamingService(format=format, standard=standard)
+        try:
+            variable_names = service.gen_var_names(items, max_length=budget, record=True)
+        except NameLengthError as e:
+            raise HTTPException(status_code=422, detail=str(e))
+
+        response = {"variable_names": variable_names, "status": "pending"}
+        if validator is not None:
+            response["validation"] = {
+                "component": component,
+                "results": {name: validator.validate(name) for name in variable_names}
+            }
+        return response
 
-    return {"variable_name": variable_name, "status": "pending"}
+    # Keep the event loop free while a large batch is generated and saved
+    return await run_in_threadpool(generate)
 
 
 # -----------------------------
@@ -129,9 +226,15 @@ async def gen_var_name(format: str, standard: str, request: Request):
 # -----------------------------
 @router.get("/pending/{standard}")
 def get_pending_variables(standard: str):
-    """Return all variables awaiting approval"""
+    """Return all variables awaiting approval, streamed entry by entry"""
     pending_path = os.path.join(os.getcwd(), f"data/standards/{standard}/pending.json")
-    return load_json(pending_path)
+    # Validate the whole file before the 200 goes out, so a corrupt file
+    # still reaches the JsonStoreError handler as a 500
+    json_store.check(pending_path)
+    return StreamingResponse(
+        json_store.iter_json(json_store.iter_items(pending_path), compact=True),
+        media_type="application/json"
+    )
 
 
 @router.post("/admin/actions/{standard}")
@@ -190,15 +293,14 @@ def validate_name(component: str, body: NameInput):
     """Validate name based on MAAB rules for the selected component."""
     name = body.name
 
-    try:
-        validator = MaabValidator(component)
-    except FileNotFoundError:
-        raise HTTPException(status_code=404, detail=f"No rules found for component '{component}'")
+    def validate():
+        validator = load_validator(component)
+        return {
+            "component": component,
+            "name": name,
+            "results": validator.validate(name)
+        }
 
-    results = validator.validate(name)
-    return {
-        "component": component,
-        "name": name,
-        "results": results
-    }
+    key = (component, name, registry.version(f"maab/rules/{component}"))
+    return validation_cache.get_or_compute(key, validate)
 
@@ -1,13 +1,26 @@
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, JSONResponse
 
 from app.api import routes
+from app.services.data_watcher import DataWatcher
+from app.services.json_store import JsonStoreError
 
 
 app = FastAPI(title="Variable Naming Service")
 
+# Reload conventions, abbreviations and rules when files under data/ change
+data_watcher = DataWatcher()
+
+@app.on_event("startup")
+def start_data_watcher():
+    data_watcher.start()
+
+@app.on_event("shutdown")
+def stop_data_watcher():
+    data_watcher.stop()
+
 # Serve static files
 app.mount("/static", StaticFiles(directory="app/static"), name="static")
 
@@ -29,6 +42,12 @@ def read_index():
     return FileResponse("app/static/maab.html")
 
 
+# Corrupt data files fail loudly instead of being overwritten
+@app.exception_handler(JsonStoreError)
+def json_store_error(request, exc: JsonStoreError):
+    return JSONResponse(status_code=500, content={"detail": f"Corrupt data file: {exc}"})
+
+
 # CORS
 app.add_middleware(
     CORSMiddleware,
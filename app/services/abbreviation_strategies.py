@@ -0,0 +1,166 @@
+#app/services/abbreviation_strategies.py
+"""
+Abbreviation strategies for words that have no approved abbreviation.
+
+Each standard declares its strategy chain in data/standards/<standard>/strategy.json:
+
+    {
+        "strategies": ["acronym", "consonant_skeleton"],
+        "max_length": 4,
+        "vocabulary": ["state", "charge"],
+        "connectors": ["of", "and"]
+    }
+
+Strategies are tried in order and the first one that returns an abbreviation
+wins. Without a strategy.json the chain is ["consonant_skeleton"] with a
+max_length of 4, which is the original behaviour of gen_var_name. The acronym
+strategy is opt-in and only splits compounds on vocabulary and connectors.
+"""
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+
+from app.services.data_registry import registry
+
+DEFAULT_CONFIG = {
+    "strategies": ["consonant_skeleton"],
+    "max_length": 4,
+    "vocabulary": [],
+    "connectors": ["of", "and"],
+}
+
+VOWELS = "aeiou"
+
+
+def truncate(word: str, engine) -> str:
+    """'temperature' -> 'Temp'"""
+    return word[:engine.max_length].capitalize()
+
+
+def consonant_skeleton(word: str, engine) -> str:
+    """First letter, then the remaining consonants with repeats collapsed: 'battery' -> 'Btry'"""
+    first = word[0]
+    rest = re.sub(f"[{VOWELS}]", "", word[1:])
+    rest = re.sub(r"(.)\1+", r"\1", rest)  # remove repeated letters
+    return (first + rest)[:engine.max_length].capitalize()
+
+
+def syllable(word: str, engine) -> str:
+    """Leading consonants, first vowel group and the consonants after it: 'concentration' -> 'Conc'"""
+    match = re.match(f"[^{VOWELS}y]*[{VOWELS}y]+[^{VOWELS}y]*", word)
+    head = match.group(0) if match else word
+    return head[:engine.max_length].capitalize()
+
+
+def acronym(word: str, engine):
+    """
+    Split a compound into vocabulary words and keep their initials:
+    'stateofcharge' -> 'SoC'. Connectors stay lowercase.
+    Returns None when the word is not a compound of known words or does not
+    start with a vocabulary word, so the result is always PascalCase.
+    """
+    parts = engine.split_compound(word)
+    if not parts or len(parts) < 2 or parts[0] in engine.connectors:
+        return None
+    return "".join(p[0] if p in engine.connectors else p[0].upper() for p in parts)
+
+
+STRATEGIES = {
+    "truncate": truncate,
+    "consonant_skeleton": consonant_skeleton,
+    "syllable": syllable,
+    "acronym": acronym,
+}
+
+
+class AbbreviationEngine:
+    def __init__(self, strategies: list, max_length: int = 4, vocabulary: list = None,
+                 connectors: list = None, cache_size: int = 4096):
+        if not isinstance(strategies, list):
+            raise ValueError("strategies must be a list of strategy names")
+        if not isinstance(max_length, int) or isinstance(max_length, bool) or max_length < 1:
+            raise ValueError(f"max_length must be a positive integer, got {max_length!r}")
+        for name, words in (("vocabulary", vocabulary), ("connectors", connectors)):
+            if words is not None and not (isinstance(words, list) and all(isinstance(w, str) for w in words)):
+                raise ValueError(f"{name} must be a list of strings")
+
+        unknown = [name for name in strategies if name not in STRATEGIES]
+        if unknown:
+            raise ValueError(f"Unknown abbreviation strategies: {unknown}")
+
+        self.strategies = [STRATEGIES[name] for name in strategies]
+        self.max_length = max_length
+        self.connectors = frozenset(w.lower() for w in (connectors or []))
+        self.vocabulary = frozenset(w.lower() for w in (vocabulary or [])) | self.connectors
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def split_compound(self, word: str):
+        """Split word into the fewest vocabulary words, or return None."""
+        n = len(word)
+        best = [None] * (n + 1)
+        best[0] = []
+        for end in range(1, n + 1):
+            for start in range(end):
+                if best[start] is None or word[start:end] not in self.vocabulary:
+                    continue
+                candidate = best[start] + [word[start:end]]
+                if best[end] is None or len(candidate) < len(best[end]):
+                    best[end] = candidate
+        return best[n]
+
+    def _compute(self, word: str) -> str:
+        for strategy in self.strategies:
+            abbr = strategy(word, self)
+            if abbr:
+                return abbr
+        return word[:self.max_length].capitalize()
+
+    def abbreviate(self, word: str) -> str:
+        """Abbreviate a lowercase word, memoized in a bounded LRU cache."""
+        with self._lock:
+            if word in self._cache:
+                self._cache.move_to_end(word)
+                return self._cache[word]
+
+        abbr = self._compute(word)
+
+        with self._lock:
+            self._cache[word] = abbr
+            self._cache.move_to_end(word)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return abbr
+
+    def abbreviate_batch(self, words) -> dict:
+        """Abbreviate every distinct word once; return {word: abbreviation}."""
+        return {word: self.abbreviate(word) for word in dict.fromkeys(words)}
+
+
+def load_strategy_config(standard: str) -> dict:
+    path = os.path.join(os.getcwd(), f"data/standards/{standard}/strategy.json")
+    config = dict(DEFAULT_CONFIG)
+    if os.path.exists(path):
+        with open(path, "r") as f:
+            data = json.load(f)
+        if not isinstance(data, dict):
+            raise ValueError(f"{path} must contain a JSON object")
+        config.update(data)
+    return config
+
+
+def get_engine(standard: str) -> AbbreviationEngine:
+    """Return the engine for a standard; it is rebuilt when its strategy.json changes."""
+    def build():
+        config = load_strategy_config(standard)
+        return AbbreviationEngine(
+            strategies=config["strategies"],
+            max_length=config["max_length"],
+            vocabulary=config["vocabulary"],
+            connectors=config["connectors"],
+        )
+
+    return registry.get(f"standards/{standard}/strategy", build)
@@ -0,0 +1,95 @@
+#app/services/data_registry.py
+"""
+Process-wide registry of the compiled indexes built from data/.
+
+Each index lives under a key such as "standards/internal/abbreviation",
+"naming_conventions/abs" or "maab/rules/file_name". Readers get the current
+index without locking; reload() rebuilds it from disk and swaps it in
+atomically, bumping the key's version number. A failed rebuild keeps the
+previous index and version.
+"""
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class DataRegistry:
+    def __init__(self):
+        self._indexes = {}
+        self._builders = {}
+        self._versions = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str, builder):
+        """Return the index for key, building it with builder on first use."""
+        index = self._indexes.get(key)
+        if index is not None:
+            return index
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is None:
+                index = builder()
+                self._indexes[key] = index
+                self._builders[key] = builder
+                self._versions.setdefault(key, 0)
+            return index
+
+    def reload(self, key: str) -> bool:
+        """
+        Rebuild the index for key and swap it in. Keys that were never built
+        only get their version bumped. Returns False if the rebuild failed.
+        """
+        builder = self._builders.get(key)
+        index = None
+        if builder is not None:
+            try:
+                index = builder()
+            except FileNotFoundError:
+                # The source was deleted; drop the index so the next get() reports it
+                with self._lock:
+                    self._indexes.pop(key, None)
+                    self._builders.pop(key, None)
+                    self._versions[key] = self._versions.get(key, 0) + 1
+                return True
+            except Exception:
+                logger.exception("Rebuilding %s failed; keeping the previous version", key)
+                return False
+
+        with self._lock:
+            if index is not None:
+                self._indexes[key] = index
+            self._versions[key] = self._versions.get(key, 0) + 1
+        return True
+
+    def version(self, key: str) -> int:
+        return self._versions.get(key, 0)
+
+    def versions(self) -> dict:
+        with self._lock:
+            return dict(self._versions)
+
+
+registry = DataRegistry()
+
+
+def key_for_path(path: str, data_root: str = None):
+    """
+    Map a file under data/ to its registry key, or None if nothing depends on it.
+    """
+    data_root = data_root or os.path.join(os.getcwd(), "data")
+    rel = os.path.relpath(path, data_root).replace(os.sep, "/")
+    if not rel.endswith(".json"):
+        return None
+    parts = rel[:-len(".json")].split("/")
+
+    if len(parts) == 3 and parts[0] == "standards" and parts[2] in ("abbreviation", "strategy"):
+        return rel[:-len(".json")]
+    if len(parts) == 3 and parts[0] == "naming_conventions":
+        return f"naming_conventions/{parts[1]}"
+    if len(parts) == 3 and parts[:2] == ["maab", "rules"]:
+        return rel[:-len(".json")]
+    if parts == ["maab", "components"]:
+        return "maab/components"
+    return None
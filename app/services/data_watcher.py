@@ -0,0 +1,170 @@
+#app/services/data_watcher.py
+"""
+Watches data/ and reloads the affected registry indexes when JSON files change.
+
+Uses inotify on Linux and falls back to polling modification times elsewhere
+(or when inotify is unavailable). Changes are debounced briefly so an editor
+save or an atomic rename triggers a single rebuild.
+"""
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import threading
+import time
+
+from app.services.data_registry import registry, key_for_path
+
+logger = logging.getLogger(__name__)
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+EVENT = struct.Struct("iIII")
+
+
+class DataWatcher:
+    def __init__(self, data_root: str = None, debounce: float = 0.2, poll_interval: float = 0.5):
+        self.data_root = data_root or os.path.join(os.getcwd(), "data")
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self._stop = threading.Event()
+        self._thread = None
+        self._fd = None
+        self._watches = {}
+        self._mtimes = {}
+
+    # -----------------------------
+    # Lifecycle
+    # -----------------------------
+    def start(self):
+        if self._thread is not None:
+            return
+        self._fd = self._init_inotify()
+        if self._fd is None:
+            # Take the baseline now so changes right after start() are not missed
+            self._mtimes = self._scan()
+        target = self._run_inotify if self._fd is not None else self._run_polling
+        self._thread = threading.Thread(target=target, name="data-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+            self._thread = None
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    # -----------------------------
+    # Reloading
+    # -----------------------------
+    def _apply(self, paths: set):
+        keys = {key_for_path(p, self.data_root) for p in paths}
+        for key in sorted(k for k in keys if k):
+            if registry.reload(key):
+                logger.info("Reloaded %s (version %d)", key, registry.version(key))
+
+    # -----------------------------
+    # inotify
+    # -----------------------------
+    def _init_inotify(self):
+        libc_name = ctypes.util.find_library("c")
+        if libc_name is None:
+            return None
+        try:
+            self._libc = ctypes.CDLL(libc_name, use_errno=True)
+            fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        except (OSError, AttributeError):
+            return None
+        if fd < 0:
+            return None
+
+        self._fd = fd
+        for dirpath, _, _ in os.walk(self.data_root):
+            self._add_watch(dirpath)
+        return fd
+
+    def _add_watch(self, path: str):
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), WATCH_MASK)
+        if wd >= 0:
+            self._watches[wd] = path
+
+    def _read_events(self) -> set:
+        changed = set()
+        try:
+            buf = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return changed
+
+        offset = 0
+        while offset + EVENT.size <= len(buf):
+            wd, mask, _, name_len = EVENT.unpack_from(buf, offset)
+            offset += EVENT.size
+            name = buf[offset:offset + name_len].rstrip(b"\0").decode("utf-8", "replace")
+            offset += name_len
+
+            directory = self._watches.get(wd)
+            if directory is None or not name:
+                continue
+            path = os.path.join(directory, name)
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    for dirpath, _, filenames in os.walk(path):
+                        self._add_watch(dirpath)
+                        changed.update(os.path.join(dirpath, f) for f in filenames)
+                continue
+            changed.add(path)
+        return changed
+
+    def _run_inotify(self):
+        pending = set()
+        first_at = None
+        while not self._stop.is_set():
+            # The debounce runs from the first queued event, so a steady stream
+            # of writes (e.g. pending.json) cannot hold back other changes
+            timeout = max(0, first_at + self.debounce - time.monotonic()) if pending else 0.5
+            ready, _, _ = select.select([self._fd], [], [], timeout)
+            if ready:
+                events = self._read_events()
+                if events and not pending:
+                    first_at = time.monotonic()
+                pending |= events
+            if pending and time.monotonic() - first_at >= self.debounce:
+                self._apply(pending)
+                pending = set()
+
+    # -----------------------------
+    # Polling fallback
+    # -----------------------------
+    def _scan(self) -> dict:
+        mtimes = {}
+        for dirpath, _, filenames in os.walk(self.data_root):
+            for name in filenames:
+                if name.endswith(".json"):
+                    path = os.path.join(dirpath, name)
+                    try:
+                        mtimes[path] = os.stat(path).st_mtime_ns
+                    except FileNotFoundError:
+                        continue
+        return mtimes
+
+    def _run_polling(self):
+        previous = self._mtimes
+        while not self._stop.wait(self.poll_interval):
+            current = self._scan()
+            changed = {p for p in current.keys() | previous.keys() if current.get(p) != previous.get(p)}
+            previous = current
+            if changed:
+                time.sleep(self.debounce)
+                self._apply(changed)
@@ -0,0 +1,254 @@
+#app/services/json_store.py
+"""
+Streaming store for flat JSON objects such as pending.json and abbreviation.json.
+
+Reads yield one key/value pair at a time, so memory is bounded by the largest
+entry rather than the file. Writes stream into a temp file in the same
+directory, fsync it and rename it over the original, so a crash never leaves a
+half-written file. Read-modify-write cycles hold an flock on a sidecar
+.<name>.lock file, so several worker processes never drop each other's
+entries. A corrupt file raises JsonStoreError instead of being treated as
+empty and overwritten.
+
+Set JSON_STORE_COMPACT=1 to write without indentation.
+"""
+import json
+import os
+import re
+import stat
+import tempfile
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows; fall back to in-process locking
+    fcntl = None
+
+CHUNK_SIZE = 64 * 1024
+MAX_ENTRY_SIZE = 16 * 1024 * 1024
+COMPACT = os.getenv("JSON_STORE_COMPACT", "") == "1"
+NEW_FILE_MODE = 0o644
+
+_WHITESPACE = re.compile(r"\s*")
+_decoder = json.JSONDecoder()
+
+_path_locks = {}
+_path_locks_guard = threading.Lock()
+
+
+class JsonStoreError(ValueError):
+    """Raised when a store file is not a valid JSON object."""
+
+
+class _Reader:
+    def __init__(self, f, path: str):
+        self.f = f
+        self.path = path
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def error(self, message: str):
+        return JsonStoreError(f"{self.path}: {message}")
+
+    def fill(self) -> bool:
+        """Read another chunk; return False at end of file."""
+        if self.eof:
+            return False
+        chunk = self.f.read(CHUNK_SIZE)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        if len(self.buf) > MAX_ENTRY_SIZE:
+            raise self.error("entry too large or file corrupt")
+        return True
+
+    def peek(self):
+        """Return the next non-whitespace character, or None at end of file."""
+        while True:
+            self.pos = _WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                return None
+
+    def expect(self, chars: str) -> str:
+        char = self.peek()
+        if char is None or char not in chars:
+            raise self.error(f"expected one of {chars!r}, found {char!r}")
+        self.pos += 1
+        return char
+
+    def value(self):
+        """Decode the next value; retry with more data if it may be cut off by the chunk boundary."""
+        while True:
+            self.peek()
+            try:
+                value, end = _decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError as e:
+                if self.fill():
+                    continue
+                raise self.error(str(e))
+            # A number at the end of the buffer may continue in the next chunk
+            if end == len(self.buf) and self.fill():
+                continue
+            self.pos = end
+            return value
+
+
+def iter_items(path: str):
+    """Yield (key, value) pairs of the top-level object in path. A missing file yields nothing."""
+    if not os.path.exists(path):
+        return
+    with open(path, "r", encoding="utf-8") as f:
+        reader = _Reader(f, path)
+        if reader.peek() is None:
+            raise reader.error("file is empty")
+        reader.expect("{")
+        if reader.peek() == "}":
+            reader.pos += 1
+        else:
+            while True:
+                key = reader.value()
+                if not isinstance(key, str):
+                    raise reader.error("object keys must be strings")
+                reader.expect(":")
+                yield key, reader.value()
+                if reader.expect(",}") == "}":
+                    break
+        if reader.peek() is not None:
+            raise reader.error("unexpected data after the top-level object")
+
+
+def check(path: str):
+    """Stream through path, raising JsonStoreError if it is corrupt."""
+    for _ in iter_items(path):
+        pass
+
+
+def pick(path: str, keys) -> dict:
+    """Return only the requested entries, streaming past the rest."""
+    wanted = set(keys)
+    return {k: v for k, v in iter_items(path) if k in wanted}
+
+
+def _encode_entry(key: str, value, compact: bool) -> str:
+    if compact:
+        return json.dumps(key) + ":" + json.dumps(value, separators=(",", ":"))
+    return "    " + json.dumps(key) + ": " + json.dumps(value, indent=4).replace("\n", "\n    ")
+
+
+def iter_json(items, compact: bool = None):
+    """Encode (key, value) pairs as a JSON object, chunk by chunk."""
+    compact = COMPACT if compact is None else compact
+    separator = "," if compact else ",\n"
+    first = True
+    for key, value in items:
+        if first:
+            yield "{" if compact else "{\n"
+            first = False
+        else:
+            yield separator
+        yield _encode_entry(key, value, compact)
+    if first:
+        yield "{}"
+    else:
+        yield "}" if compact else "\n}"
+
+
+def _write_temp(path: str, items, compact: bool) -> str:
+    """Stream items into a fsynced temp file next to path and return its name."""
+    directory = os.path.dirname(path) or "."
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        # mkstemp creates 0600; keep the mode of the file being replaced
+        try:
+            os.chmod(tmp_path, stat.S_IMODE(os.stat(path).st_mode))
+        except FileNotFoundError:
+            os.chmod(tmp_path, NEW_FILE_MODE)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            for chunk in iter_json(items, compact):
+                f.write(chunk)
+            f.flush()
+            os.fsync(f.fileno())
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    return tmp_path
+
+
+def _commit(tmp_path: str, path: str):
+    os.replace(tmp_path, path)
+    # Persist the rename itself
+    dir_fd = os.open(os.path.dirname(path) or ".", os.O_RDONLY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+def write_items(path: str, items, compact: bool = None):
+    """Atomically replace path with the given (key, value) pairs."""
+    _commit(_write_temp(path, items, compact), path)
+
+
+def _lock_for(path: str) -> threading.Lock:
+    with _path_locks_guard:
+        return _path_locks.setdefault(os.path.abspath(path), threading.Lock())
+
+
+@contextmanager
+def _locked(path: str):
+    """Hold the in-process lock and an exclusive flock on the sidecar lock file."""
+    with _lock_for(path):
+        if fcntl is None:
+            yield
+            return
+        lock_path = os.path.join(os.path.dirname(path) or ".", f".{os.path.basename(path)}.lock")
+        with open(lock_path, "a") as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def update(path: str, changes: dict, defaults: dict = None, compact: bool = None) -> dict:
+    """
+    Set the entries in changes, and add the entries in defaults only where the
+    key is not present yet, streaming the existing file through. Returns the
+    entries actually written; the file is only read, never rewritten, when
+    that is empty.
+    """
+    defaults = {k: v for k, v in (defaults or {}).items() if k not in changes}
+    with _locked(path):
+        existing = pick(path, list(changes) + list(defaults))
+        written = {
+            key: value for key, value in changes.items()
+            if key not in existing or existing[key] != value
+        }
+        written.update({key: value for key, value in defaults.items() if key not in existing})
+        if not written:
+            return written
+
+        def merged():
+            for key, value in iter_items(path):
+                yield key, written.get(key, value)
+            for key, value in written.items():
+                if key not in existing:
+                    yield key, value
+
+        write_items(path, merged(), compact)
+        return written
+
+
+def delete(path: str, keys, compact: bool = None) -> dict:
+    """Remove the given keys, streaming the rest through. Returns the removed entries."""
+    with _locked(path):
+        removed = pick(path, keys)
+        if removed:
+            write_items(path, ((k, v) for k, v in iter_items(path) if k not in removed), compact)
+        return removed
@@ -2,17 +2,43 @@ import os
 import json
 import re
 
+from app.services.snapshot import open_snapshot, refresh_snapshot
+from app.services.data_registry import registry
+
 class MaabValidator:
     def __init__(self, component: str):
         self.component = component
         self.rules = self._load_rules(component)
     
     def _load_rules(self, component: str):
+        return registry.get(f"maab/rules/{component}", lambda: self._build_rules(component))
+
+    def _build_rules(self, component: str):
         path = os.path.join(os.getcwd(), f"data/maab/rules/{component}.json")
         if not os.path.exists(path):
             raise FileNotFoundError(f"Rules file for component '{component}' not found.")
+        snapshot = open_snapshot(path)
+        if snapshot is not None:
+            return snapshot
+
+        # No current snapshot: parse and check the JSON, then recompile a stale snapshot
         with open(path, "r") as f:
-            return json.load(f)
+            rules = json.load(f)
+        self._check_rules(rules)
+        refresh_snapshot(path, json_values=True)
+        snapshot = open_snapshot(path)
+        return snapshot if snapshot is not None else rules
+
+    @staticmethod
+    def _check_rules(rules):
+        """Reject rule files that would break validate()"""
+        if not isinstance(rules, dict):
+            raise ValueError("Rules file must contain a JSON object.")
+        for rule_key, rule in rules.items():
+            if not isinstance(rule, dict) or "description" not in rule:
+                raise ValueError(f"Rule '{rule_key}' must be an object with a description.")
+            if "pattern" in rule:
+                re.compile(rule["pattern"])
     
     def validate(self, name: str) -> dict:
         results = {}
@@ -59,6 +85,15 @@ class MaabValidator:
                 }
         return results
     
+    def max_length(self):
+        """Smallest max_length enforced by this component's rules, or None."""
+        limits = [
+            rule["params"]["max_length"]
+            for rule in self.rules.values()
+            if rule.get("function") == "validate_max_length" and "max_length" in rule.get("params", {})
+        ]
+        return min(limits) if limits else None
+
     # Example validation functions:
 
     def validate_not_reserved_matlab_word(self, name: str) -> bool:
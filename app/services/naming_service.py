@@ -1,9 +1,13 @@
 #app/services/naming_service.py
 import json
-import re
 
 import os
 from app.services.llm_abbreviator import get_abbreviation_from_llm_local
+from app.services.snapshot import open_snapshot, refresh_snapshot
+from app.services.data_registry import registry
+from app.services import json_store
+from app.services.abbreviation_strategies import get_engine
+from app.services.template_compiler import CompiledTemplate
 
 class NamingService:
 
@@ -46,11 +50,19 @@ class NamingService:
         self.format = format
         self.standard = standard
         self.base_path = os.path.join(os.getcwd(), f"data/naming_conventions/{self.format}")
-        self.config = self._load_json("format.json")
 
+        self.config, self.mappings, self.compiled = registry.get(
+            f"naming_conventions/{self.format}", self._build_format
+        )
         self.fields = self.config["fields"]
         self.template = self.config["template"]
-        self.mappings = self._load_all_mappings()
+
+
+    def _build_format(self):
+        """Load format.json and its mapping files and compile the template"""
+        config = self._load_json("format.json")
+        mappings = self._load_all_mappings(config["fields"])
+        return config, mappings, CompiledTemplate(config["template"], config["fields"], mappings)
 
 
     def _load_json(self, relative_path: str):
@@ -59,50 +71,51 @@ class NamingService:
             return json.load(f)
 
 
-    def _load_all_mappings(self):
+    def _load_all_mappings(self, fields: list):
         mappings = {}
-        for field in self.fields:
+        for field in fields:
             file_path = os.path.join(self.base_path, f"{field}s.json")
-            if os.path.exists(file_path):
+            snapshot = open_snapshot(file_path)
+            if snapshot is None:
+                refresh_snapshot(file_path)
+                snapshot = open_snapshot(file_path)
+            if snapshot is not None:
+                mappings[field] = snapshot
+            elif os.path.exists(file_path):
                 mappings[field] = self._load_json(f"{field}s.json")
         return mappings
 
 
     def _load_abbreviation(self, standard: str):
-        """Load abbreviation from the JSON file for the selected standard"""
-        abbr_path = os.path.join(os.getcwd(), f"data/standards/{standard}/abbreviation.json")
-        if os.path.exists(abbr_path):
-            with open(abbr_path, "r") as f:
-                return {k.lower(): v for k, v in json.load(f).items()}
-        return {}
-
+        """Return the abbreviation index for the selected standard"""
+        return registry.get(
+            f"standards/{standard}/abbreviation",
+            lambda: self._build_abbreviation(standard)
+        )
 
-    def _add_new_abbreviations(self, standard: str, new_abbrs: dict):
-        """Append multiple newly generated LLM entries to pending.json as key-value pairs"""
-        pending_path = os.path.join(os.getcwd(), f"data/standards/{standard}/pending.json")
 
-        # Load existing pending entries
-        if os.path.exists(pending_path):
-            with open(pending_path, "r") as f:
-                try:
-                    pending = json.load(f)
-                except json.JSONDecodeError:
-                    pending = {}
-        else:
-            pending = {}
+    def _build_abbreviation(self, standard: str):
+        """Load abbreviation from the snapshot or JSON file for the selected standard"""
+        abbr_path = os.path.join(os.getcwd(), f"data/standards/{standard}/abbreviation.json")
+        snapshot = open_snapshot(abbr_path)
+        if snapshot is None:
+            # Recompile a stale snapshot, if one was ever built
+            refresh_snapshot(abbr_path, lowercase_keys=True)
+            snapshot = open_snapshot(abbr_path)
+        if snapshot is not None:
+            return snapshot
+        return {k.lower(): v for k, v in json_store.iter_items(abbr_path)}
 
-        # Add only entries that are not already present
-        updated = False
-        for word, abbr in new_abbrs.items():
-            if word not in pending:
-                pending[word] = abbr
-                updated = True
 
-        # Save only if something new was added
-        if updated:
-            with open(pending_path, "w") as f:
-                json.dump(pending, f, indent=4)
+    def _add_new_abbreviations(self, standard: str, new_abbrs: dict, names: dict = None):
+        """
+        Append multiple newly generated LLM entries to pending.json as key-value pairs,
+        together with any generated names, in a single pass over the file
+        """
+        pending_path = os.path.join(os.getcwd(), f"data/standards/{standard}/pending.json")
 
+        # Names always record their description; abbreviations are added only if not present
+        json_store.update(pending_path, names or {}, defaults=new_abbrs)
 
 
     def _approve_pending_abbreviations(self, standard: str, to_approve: list):
@@ -113,44 +126,14 @@ class NamingService:
         pending_path = os.path.join(os.getcwd(), f"data/standards/{standard}/pending.json")
         approved_path = os.path.join(os.getcwd(), f"data/standards/{standard}/abbreviation.json")
 
-        # Load pending
-        if os.path.exists(pending_path):
-            with open(pending_path, "r") as f:
-                try:
-                    pending = json.load(f)
-                except json.JSONDecodeError:
-                    pending = {}
-        else:
-            pending = {}
-
-        # Load approved
-        if os.path.exists(approved_path):
-            with open(approved_path, "r") as f:
-                try:
-                    approved = json.load(f)
-                except json.JSONDecodeError:
-                    approved = {}
-        else:
-            approved = {}
-
-        approved_items = {}
-        updated = False
-
-        for word in to_approve:
-            if word in pending:
-                approved[word] = pending[word]
-                approved_items[word] = pending[word]
-                del pending[word]
-                updated = True
-
-        if updated:
-            # Save updated approved
-            with open(approved_path, "w") as f:
-                json.dump(approved, f, indent=4)
-
-            # Save updated pending
-            with open(pending_path, "w") as f:
-                json.dump(pending, f, indent=4)
+        approved_items = json_store.pick(pending_path, to_approve)
+
+        if approved_items:
+            # Save approved first so a failure never loses an entry
+            json_store.update(approved_path, approved_items)
+            registry.reload(f"standards/{standard}/abbreviation")
+
+            json_store.delete(pending_path, approved_items)
 
         return approved_items
 
@@ -158,81 +141,92 @@ class NamingService:
     def _delete_pending_abbreviations(self, standard: str, to_delete: list):
         """Delete multiple entries from pending.json"""
         pending_path = os.path.join(os.getcwd(), f"data/standards/{standard}/pending.json")
+        json_store.delete(pending_path, to_delete)
 
-        if os.path.exists(pending_path):
-            with open(pending_path, "r") as f:
-                try:
-                    pending = json.load(f)
-                except json.JSONDecodeError:
-                    pending = {}
-        else:
-            pending = {}
 
-        updated = False
-        for word in to_delete:
-            if word in pending:
-                del pending[word]
-                updated = True
 
-        if updated:
-            with open(pending_path, "w") as f:
-                json.dump(pending, f, indent=4)
+    def _abbreviate_description(self, description: str, abbreviations, abbreviate):
+        """Return (abbreviated description tokens, newly generated abbreviations)."""
+        final_tokens = []
+        new_abbreviations = {}
 
+        for token in description.split():
+            token_lower = token.lower()
+            if token_lower in abbreviations:
+                abbr = abbreviations[token_lower]
+            elif token_lower in self.STOPWORDS:
+                abbr = ""  # ignore stopwords
+            else:
+                abbr = abbreviate(token_lower)
+                new_abbreviations[token_lower] = abbr
+            final_tokens.append(abbr)
 
+        return [t for t in final_tokens if t], new_abbreviations
 
-    def gen_var_name(self, standard: str = None, **kwargs):
+
+    def gen_var_name(self, standard: str = None, max_length: int = None, user_data: dict = None,
+                     record: bool = False, **kwargs):
         """
         Generate PascalCase variable name based on description.
-        Uses known abbreviations, ignores stopwords, and generates abbreviations for unknown words.
-        Compatible with your previous API call.
+        Uses known abbreviations, ignores stopwords, and generates abbreviations for unknown words
+        with the strategy chain configured for the standard.
+        With max_length, the description is shortened until the name fits.
+        Field values come from user_data, or from keyword arguments as in your previous API call.
+        With record, the name and its description are also saved to pending.json.
         """
         standard = standard or self.standard
+        user_data = kwargs if user_data is None else user_data
         abbreviations = self._load_abbreviation(standard)
+        engine = get_engine(standard)
 
-        values = {}
-
-        for field in self.fields:
-            user_input = kwargs.get(field, "")
-
-            if field == "description":
-                tokens = user_input.split()
-                final_tokens = []
-                new_abbreviations = {}
-
-                for token in tokens:
-                    token_lower = token.lower()
-                    if token_lower in abbreviations:
-                        abbr = abbreviations[token_lower]
-                    elif token_lower in self.STOPWORDS:
-                        abbr = ""  # ignore stopwords
-                    else:
-                        # Generate abbreviation
-                        first = token_lower[0]
-                        rest = re.sub(r'[aeiou]', '', token_lower[1:])
-                        rest = re.sub(r'(.)\1+', r'\1', rest)  # remove repeated letters
-                        abbr = (first + rest)[:4].capitalize()
-                        new_abbreviations[token_lower] = abbr
-                    final_tokens.append(abbr)
-
-                final_variable = "".join([t for t in final_tokens if t])
-
-                # Save newly generated abbreviations if needed
-                if new_abbreviations:
-                    self._add_new_abbreviations(standard, new_abbreviations)
-
-                values[field] = final_variable
-
-            else:
-                mapping = self.mappings.get(field, {})
-                values[field] = mapping.get(user_input, user_input)
-
-        return self.template.format(**values)
-    
-
-
-
+        tokens, new_abbreviations = self._abbreviate_description(
+            user_data.get("description", ""), abbreviations, engine.abbreviate
+        )
 
+        # Render first: a name rejected for its length must not touch pending.json
+        variable_name = self.compiled.render(user_data, tokens, max_length)
 
+        # Save newly generated abbreviations (and the name) if needed
+        names = {variable_name: user_data.get("description", "")} if record else {}
+        if new_abbreviations or names:
+            self._add_new_abbreviations(standard, new_abbreviations, names)
 
+        return variable_name
 
 
+    def gen_var_names(self, items: list, standard: str = None, max_length: int = None, record: bool = False):
+        """
+        Generate variable names for a whole batch of inputs.
+        Each distinct unknown word is abbreviated once for the batch and
+        pending.json is written once at the end. With record, the names and
+        their descriptions are saved in that same write.
+        """
+        standard = standard or self.standard
+        abbreviations = self._load_abbreviation(standard)
+        engine = get_engine(standard)
+
+        words = [
+            token.lower()
+            for item in items
+            for token in item.get("description", "").split()
+        ]
+        batch = engine.abbreviate_batch(
+            w for w in words if w not in abbreviations and w not in self.STOPWORDS
+        )
+
+        names = []
+        new_abbreviations = {}
+        for item in items:
+            tokens, new_abbrs = self._abbreviate_description(
+                item.get("description", ""), abbreviations, batch.__getitem__
+            )
+            new_abbreviations.update(new_abbrs)
+            names.append(self.compiled.render(item, tokens, max_length))
+
+        recorded = {
+            name: item.get("description", "") for item, name in zip(items, names)
+        } if record else {}
+        if new_abbreviations or recorded:
+            self._add_new_abbreviations(standard, new_abbreviations, recorded)
+
+        return names
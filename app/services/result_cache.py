@@ -0,0 +1,50 @@
+#app/services/result_cache.py
+"""
+Bounded LRU cache with in-flight deduplication.
+
+Concurrent calls with the same key share one computation: the first caller
+computes, the others wait for its result. Errors are passed to the waiting
+callers but never cached. Keys should include the data versions the result
+depends on, so entries built from old data simply stop matching and age out.
+"""
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+
+
+class ResultCache:
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._cache = OrderedDict()
+        self._inflight = {}
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key, compute):
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+
+        if not owner:
+            return future.result()
+
+        try:
+            value = compute()
+        except BaseException as e:
+            with self._lock:
+                self._inflight.pop(key, None)
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            self._cache[key] = value
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+            self._inflight.pop(key, None)
+        future.set_result(value)
+        return value
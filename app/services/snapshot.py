@@ -0,0 +1,235 @@
+#app/services/snapshot.py
+"""
+Compact binary snapshots of the JSON dictionaries under data/.
+
+Each snapshot is a sorted string table that workers mmap read-only, so the
+page cache shares one copy between processes and opening it costs a stat and
+an mmap instead of a full JSON parse.
+
+Layout (little-endian):
+    header   magic (8 bytes), entry count (u32), flags (u32),
+             source size, mtime_ns and inode (u64 each)
+    entries  count x (key_off, key_len, val_off, val_len) as u32, source order
+    index    count x entry number (u32), sorted by key bytes
+    blob     utf-8 keys and values
+
+Build all snapshots with:
+    python -m app.services.snapshot
+"""
+import json
+import mmap
+import os
+import stat
+import struct
+import tempfile
+import threading
+from collections.abc import Mapping
+
+MAGIC = b"VNSNAP2\0"
+HEADER = struct.Struct("<8sIIQQQ")
+ENTRY = struct.Struct("<IIII")
+INDEX = struct.Struct("<I")
+
+FLAG_JSON_VALUES = 1
+
+
+class Snapshot(Mapping):
+    """Read-only dict view over an mmapped snapshot file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            file_stat = os.fstat(f.fileno())
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.file_id = _file_id(file_stat)
+
+        if len(self._mm) < HEADER.size:
+            raise ValueError(f"Not a snapshot file: {path}")
+        magic, self._count, self._flags, *source = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Not a snapshot file: {path}")
+        # (size, mtime_ns, inode) of the JSON file this snapshot was compiled from
+        self.source_id = tuple(source)
+        self._entries_at = HEADER.size
+        self._index_at = self._entries_at + self._count * ENTRY.size
+
+    def _entry(self, i: int):
+        return ENTRY.unpack_from(self._mm, self._entries_at + i * ENTRY.size)
+
+    def _key_bytes(self, i: int) -> bytes:
+        key_off, key_len, _, _ = self._entry(i)
+        return self._mm[key_off:key_off + key_len]
+
+    def _value(self, i: int):
+        _, _, val_off, val_len = self._entry(i)
+        raw = self._mm[val_off:val_off + val_len].decode("utf-8")
+        if self._flags & FLAG_JSON_VALUES:
+            return json.loads(raw)
+        return raw
+
+    def _find(self, key) -> int:
+        """Binary search the sorted index; return the entry number or -1."""
+        if not isinstance(key, str):
+            return -1
+        target = key.encode("utf-8")
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            i = INDEX.unpack_from(self._mm, self._index_at + mid * INDEX.size)[0]
+            probe = self._key_bytes(i)
+            if probe < target:
+                lo = mid + 1
+            elif probe > target:
+                hi = mid
+            else:
+                return i
+        return -1
+
+    def __getitem__(self, key):
+        i = self._find(key)
+        if i < 0:
+            raise KeyError(key)
+        return self._value(i)
+
+    def __contains__(self, key):
+        return self._find(key) >= 0
+
+    def __iter__(self):
+        for i in range(self._count):
+            yield self._key_bytes(i).decode("utf-8")
+
+    def __len__(self):
+        return self._count
+
+
+def _file_id(file_stat) -> tuple:
+    return (file_stat.st_size, file_stat.st_mtime_ns, file_stat.st_ino)
+
+
+def snapshot_path(json_path: str) -> str:
+    return os.path.splitext(json_path)[0] + ".snap"
+
+
+def compile_snapshot(json_path: str, lowercase_keys: bool = False, json_values: bool = False) -> str:
+    """Compile a flat JSON object into a snapshot next to it; return the snapshot path."""
+    with open(json_path, "r") as f:
+        # Identify exactly the file that was read, even if it is replaced meanwhile
+        source_id = _file_id(os.fstat(f.fileno()))
+        data = json.load(f)
+    if not isinstance(data, dict):
+        raise ValueError(f"{json_path} must contain a JSON object")
+    if lowercase_keys:
+        data = {k.lower(): v for k, v in data.items()}
+
+    keys = [k.encode("utf-8") for k in data]
+    values = [
+        (json.dumps(v, separators=(",", ":")) if json_values else str(v)).encode("utf-8")
+        for v in data.values()
+    ]
+    count = len(keys)
+
+    blob_at = HEADER.size + count * (ENTRY.size + INDEX.size)
+    entries = bytearray()
+    blob = bytearray()
+    for key, value in zip(keys, values):
+        key_off = blob_at + len(blob)
+        blob += key
+        val_off = blob_at + len(blob)
+        blob += value
+        entries += ENTRY.pack(key_off, len(key), val_off, len(value))
+
+    order = sorted(range(count), key=lambda i: keys[i])
+    index = b"".join(INDEX.pack(i) for i in order)
+
+    flags = FLAG_JSON_VALUES if json_values else 0
+    out_path = snapshot_path(json_path)
+    # A unique temp file, so workers compiling the same snapshot never share one
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(out_path) or ".",
+                                    prefix=f".{os.path.basename(out_path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(HEADER.pack(MAGIC, count, flags, *source_id))
+            f.write(entries)
+            f.write(index)
+            f.write(blob)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, stat.S_IMODE(os.stat(json_path).st_mode))
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    # Readers holding the old mapping keep a valid view of the replaced inode
+    os.replace(tmp_path, out_path)
+    return out_path
+
+
+_open_snapshots = {}
+_open_lock = threading.Lock()
+
+
+def open_snapshot(json_path: str):
+    """
+    Return the Snapshot compiled from json_path, or None when there is no
+    snapshot, the JSON file is gone, or the JSON file is not exactly the one
+    the snapshot was compiled from (size, mtime and inode must all match).
+    """
+    snap_path = snapshot_path(json_path)
+    try:
+        snap_stat = os.stat(snap_path)
+        json_stat = os.stat(json_path)
+    except FileNotFoundError:
+        return None
+
+    with _open_lock:
+        snap = _open_snapshots.get(snap_path)
+        if snap is None or snap.file_id != _file_id(snap_stat):
+            try:
+                snap = Snapshot(snap_path)
+            except ValueError:
+                return None
+            _open_snapshots[snap_path] = snap
+    if snap.source_id != _file_id(json_stat):
+        return None
+    return snap
+
+
+def refresh_snapshot(json_path: str, lowercase_keys: bool = False, json_values: bool = False):
+    """Recompile json_path only if it exists and a snapshot of it was already built."""
+    if os.path.exists(json_path) and os.path.exists(snapshot_path(json_path)):
+        compile_snapshot(json_path, lowercase_keys=lowercase_keys, json_values=json_values)
+
+
+def build_all(data_root: str = None):
+    """Compile every standard, naming convention and MAAB rule file under data/."""
+    data_root = data_root or os.path.join(os.getcwd(), "data")
+    built = []
+
+    standards_root = os.path.join(data_root, "standards")
+    if os.path.isdir(standards_root):
+        for standard in sorted(os.listdir(standards_root)):
+            path = os.path.join(standards_root, standard, "abbreviation.json")
+            if os.path.exists(path):
+                built.append(compile_snapshot(path, lowercase_keys=True))
+
+    conventions_root = os.path.join(data_root, "naming_conventions")
+    if os.path.isdir(conventions_root):
+        for fmt in sorted(os.listdir(conventions_root)):
+            fmt_dir = os.path.join(conventions_root, fmt)
+            if not os.path.isdir(fmt_dir):
+                continue
+            for name in sorted(os.listdir(fmt_dir)):
+                if name.endswith(".json") and name != "format.json":
+                    built.append(compile_snapshot(os.path.join(fmt_dir, name)))
+
+    rules_root = os.path.join(data_root, "maab", "rules")
+    if os.path.isdir(rules_root):
+        for name in sorted(os.listdir(rules_root)):
+            if name.endswith(".json"):
+                built.append(compile_snapshot(os.path.join(rules_root, name), json_values=True))
+
+    return built
+
+
+if __name__ == "__main__":
+    for path in build_all():
+        print(path)
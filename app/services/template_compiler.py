@@ -0,0 +1,88 @@
+#app/services/template_compiler.py
+"""
+Compiles a format.json template into a formatter with its field resolvers
+bound ahead of time, so generating a name is one pass over a prepared list
+instead of str.format plus a mapping lookup per field.
+"""
+from string import Formatter
+
+DESCRIPTION_FIELD = "description"
+
+
+class NameLengthError(ValueError):
+    """Raised when a name cannot fit max_length even with its description shortened."""
+
+
+class CompiledTemplate:
+    def __init__(self, template: str, fields: list, mappings: dict):
+        self.template = template
+        self.fields = fields
+        self.parts = []  # (literal, field name or None, resolver or None)
+
+        for literal, field, spec, conversion in Formatter().parse(template):
+            if spec or conversion:
+                raise ValueError(f"Format specs are not supported in templates: {template}")
+            if field is None:
+                self.parts.append((literal, None, None))
+            elif field == DESCRIPTION_FIELD:
+                self.parts.append((literal, field, None))
+            else:
+                self.parts.append((literal, field, self._resolver(mappings.get(field))))
+
+    @staticmethod
+    def _resolver(mapping):
+        if not mapping:
+            return lambda value: value
+        get = mapping.get
+        return lambda value: get(value, value)
+
+    def _fixed_segments(self, user_data: dict):
+        """Resolve every field except description; None marks the description slot."""
+        segments = []
+        for literal, field, resolver in self.parts:
+            if literal:
+                segments.append(literal)
+            if field is None:
+                continue
+            if field == DESCRIPTION_FIELD:
+                segments.append(None)
+            else:
+                segments.append(str(resolver(user_data.get(field, ""))))
+        return segments
+
+    def render(self, user_data: dict, description_tokens: list, max_length: int = None) -> str:
+        """
+        Build the name. With max_length, the description tokens are shortened
+        (longest first, down to one letter each, then dropped from the end)
+        until the whole name fits. Raises NameLengthError when the other fields
+        leave no room for at least one letter of the description.
+        """
+        segments = self._fixed_segments(user_data)
+        tokens = list(description_tokens)
+
+        if max_length is not None:
+            fixed_length = sum(len(s) for s in segments if s is not None)
+            slots = segments.count(None)
+            budget = (max_length - fixed_length) // slots if slots else max_length - fixed_length
+            if budget < (1 if tokens and slots else 0):
+                raise NameLengthError(
+                    f"Name needs more than {max_length} characters: the fields other than "
+                    f"the description already use {fixed_length}."
+                )
+            if slots:
+                tokens = shorten_tokens(tokens, budget)
+
+        description = "".join(tokens)
+        return "".join(description if s is None else s for s in segments)
+
+
+def shorten_tokens(tokens: list, budget: int) -> list:
+    """Shorten tokens until their joined length fits within budget."""
+    tokens = list(tokens)
+    while tokens and sum(len(t) for t in tokens) > budget:
+        longest = max(range(len(tokens)), key=lambda i: (len(tokens[i]), i))
+        if len(tokens[longest]) > 1:
+            tokens[longest] = tokens[longest][:-1]
+        else:
+            tokens.pop()
+    return tokens
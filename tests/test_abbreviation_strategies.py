@@ -0,0 +1,56 @@
+import pytest
+
+from app.services.abbreviation_strategies import AbbreviationEngine
+
+
+def make_engine(strategies):
+    return AbbreviationEngine(
+        strategies=strategies,
+        vocabulary=["state", "charge", "health", "time"],
+        connectors=["of", "and"],
+    )
+
+
+def test_consonant_skeleton_matches_original_fallback():
+    engine = make_engine(["consonant_skeleton"])
+    assert engine.abbreviate("battery") == "Btry"
+    assert engine.abbreviate("heat") == "Ht"
+
+
+def test_acronym_splits_on_vocabulary_and_connectors():
+    engine = make_engine(["acronym", "consonant_skeleton"])
+    assert engine.abbreviate("stateofcharge") == "SoC"
+    assert engine.abbreviate("stateandhealth") == "SaH"
+
+
+def test_acronym_leaves_ordinary_words_alone():
+    engine = make_engine(["acronym", "consonant_skeleton"])
+    for word in ["heat", "ion", "upon", "onto", "another", "timeout"]:
+        assert engine.abbreviate(word) == make_engine(["consonant_skeleton"]).abbreviate(word)
+
+
+def test_acronym_never_starts_lowercase():
+    engine = make_engine(["acronym"])
+    assert engine.abbreviate("ofcharge") == "Ofch"
+    assert engine.abbreviate("ofand") == "Ofan"
+
+
+def test_batch_returns_each_distinct_word_once():
+    engine = make_engine(["consonant_skeleton"])
+    engine.cache_size = 1
+    batch = engine.abbreviate_batch(["battery", "voltage", "battery", "current"])
+    assert batch == {"battery": "Btry", "voltage": "Vltg", "current": "Crnt"}
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"strategies": "truncate"},
+    {"strategies": ["unknown"]},
+    {"strategies": ["truncate"], "max_length": "4"},
+    {"strategies": ["truncate"], "max_length": 0},
+    {"strategies": ["truncate"], "max_length": True},
+    {"strategies": ["truncate"], "vocabulary": "state"},
+    {"strategies": ["truncate"], "connectors": ["of", 1]},
+])
+def test_invalid_config_is_rejected(kwargs):
+    with pytest.raises(ValueError):
+        AbbreviationEngine(**kwargs)
@@ -0,0 +1,51 @@
+import os
+
+from app.services.data_registry import DataRegistry, key_for_path
+
+DATA_ROOT = os.path.join("/srv", "data")
+
+
+def data_path(*parts):
+    return os.path.join(DATA_ROOT, *parts)
+
+
+def test_key_for_path():
+    assert key_for_path(data_path("standards", "internal", "abbreviation.json"), DATA_ROOT) == "standards/internal/abbreviation"
+    assert key_for_path(data_path("standards", "internal", "pending.json"), DATA_ROOT) is None
+    assert key_for_path(data_path("naming_conventions", "abs", "modules.json"), DATA_ROOT) == "naming_conventions/abs"
+    assert key_for_path(data_path("maab", "rules", "file_name.json"), DATA_ROOT) == "maab/rules/file_name"
+    assert key_for_path(data_path("standards", "internal", "abbreviation.snap"), DATA_ROOT) is None
+    assert key_for_path(data_path("standards", "internal", "notes.json"), DATA_ROOT) is None
+
+
+def test_reload_swaps_index_and_bumps_version():
+    registry = DataRegistry()
+    values = iter(["v1", "v2"])
+    assert registry.get("k", lambda: next(values)) == "v1"
+    assert registry.version("k") == 0
+
+    assert registry.reload("k")
+    assert registry.get("k", lambda: "unused") == "v2"
+    assert registry.version("k") == 1
+
+
+def test_failed_reload_keeps_previous_index():
+    registry = DataRegistry()
+    calls = []
+
+    def build():
+        calls.append(1)
+        if len(calls) > 1:
+            raise ValueError("bad file")
+        return "good"
+
+    registry.get("k", build)
+    assert not registry.reload("k")
+    assert registry.get("k", build) == "good"
+    assert registry.version("k") == 0
+
+
+def test_reload_of_unbuilt_key_only_bumps_version():
+    registry = DataRegistry()
+    registry.reload("standards/internal/strategy")
+    assert registry.version("standards/internal/strategy") == 1
@@ -0,0 +1,116 @@
+import os
+import threading
+import time
+
+import pytest
+
+from app.services import data_watcher
+from app.services.data_registry import DataRegistry
+from app.services.data_watcher import DataWatcher
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    fresh = DataRegistry()
+    monkeypatch.setattr(data_watcher, "registry", fresh)
+    return fresh
+
+
+@pytest.fixture
+def data_root(tmp_path):
+    for parts in [("standards", "internal"), ("maab", "rules")]:
+        os.makedirs(os.path.join(tmp_path, *parts))
+    return str(tmp_path)
+
+
+def write(path, text="{}"):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(text)
+
+
+def wait_for(condition, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.02)
+    return condition()
+
+
+def start_watcher(data_root, polling):
+    watcher = DataWatcher(data_root, debounce=0.05, poll_interval=0.05)
+    if polling:
+        watcher._init_inotify = lambda: None
+    watcher.start()
+    if not polling and watcher._fd is None:
+        watcher.stop()
+        pytest.skip("inotify is not available")
+    return watcher
+
+
+@pytest.mark.parametrize("polling", [False, True], ids=["inotify", "polling"])
+def test_changed_and_removed_files_reload_their_keys(data_root, registry, polling):
+    rules = os.path.join(data_root, "maab", "rules", "file_name.json")
+    write(rules)
+    watcher = start_watcher(data_root, polling)
+    try:
+        write(rules, '{"a": {"description": "d"}}')
+        assert wait_for(lambda: registry.version("maab/rules/file_name") == 1)
+
+        os.remove(rules)
+        assert wait_for(lambda: registry.version("maab/rules/file_name") == 2)
+
+        write(os.path.join(data_root, "standards", "internal", "notes.txt"), "ignored")
+        time.sleep(0.3)
+        assert registry.versions() == {"maab/rules/file_name": 2}
+    finally:
+        watcher.stop()
+
+
+@pytest.mark.parametrize("polling", [False, True], ids=["inotify", "polling"])
+def test_files_in_new_directories_are_watched(data_root, registry, polling):
+    watcher = start_watcher(data_root, polling)
+    try:
+        # Let the watcher settle before the directory appears
+        time.sleep(0.1)
+        write(os.path.join(data_root, "naming_conventions", "abs", "modules.json"))
+        assert wait_for(lambda: registry.version("naming_conventions/abs") >= 1)
+
+        version = registry.version("naming_conventions/abs")
+        write(os.path.join(data_root, "naming_conventions", "abs", "units.json"))
+        assert wait_for(lambda: registry.version("naming_conventions/abs") > version)
+    finally:
+        watcher.stop()
+
+
+def test_steady_writes_do_not_hold_back_other_changes(data_root, registry):
+    pending = os.path.join(data_root, "standards", "internal", "pending.json")
+    rules = os.path.join(data_root, "maab", "rules", "file_name.json")
+    write(rules)
+    watcher = start_watcher(data_root, polling=False)
+    stop_writes = threading.Event()
+
+    def keep_writing():
+        while not stop_writes.is_set():
+            write(pending)
+            time.sleep(0.01)
+
+    writer = threading.Thread(target=keep_writing)
+    writer.start()
+    try:
+        time.sleep(0.1)
+        write(rules, '{"a": {"description": "d"}}')
+        assert wait_for(lambda: registry.version("maab/rules/file_name") == 1, timeout=1.0)
+        assert writer.is_alive()
+    finally:
+        stop_writes.set()
+        writer.join()
+        watcher.stop()
+
+
+def test_scan_reports_json_files_only(data_root):
+    write(os.path.join(data_root, "standards", "internal", "abbreviation.json"))
+    write(os.path.join(data_root, "standards", "internal", "abbreviation.snap"), "")
+    mtimes = DataWatcher(data_root)._scan()
+    assert list(mtimes) == [os.path.join(data_root, "standards", "internal", "abbreviation.json")]
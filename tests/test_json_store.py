@@ -0,0 +1,160 @@
+import json
+import multiprocessing
+import os
+import stat
+
+import pytest
+
+from app.services import json_store
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    """Force values to straddle chunk boundaries."""
+    monkeypatch.setattr(json_store, "CHUNK_SIZE", 3)
+
+
+def write_text(path, text):
+    with open(path, "w") as f:
+        f.write(text)
+
+
+def test_iter_items_across_chunk_boundaries(tmp_path, small_chunks):
+    data = {
+        "CaAtddrv_A_AxlrBtrySt": "axillary battery state",
+        "number": 1234567890,
+        "float": -12.5e3,
+        "flags": [True, False, None],
+        "nested": {"a": {"b": "c"}},
+        "escaped \"key\"": "line\nbreak ü",
+    }
+    path = str(tmp_path / "pending.json")
+    write_text(path, json.dumps(data, indent=4))
+
+    assert list(json_store.iter_items(path)) == list(data.items())
+
+
+def test_missing_file_yields_nothing(tmp_path):
+    assert list(json_store.iter_items(str(tmp_path / "missing.json"))) == []
+
+
+def test_empty_object(tmp_path):
+    path = str(tmp_path / "pending.json")
+    write_text(path, " {\n} ")
+    assert list(json_store.iter_items(path)) == []
+
+
+@pytest.mark.parametrize("text", [
+    "",
+    "   ",
+    "[1, 2]",
+    '{"a": "b"',
+    '{"a": "b",}',
+    '{"a" "b"}',
+    '{"a": "b", "c": ',
+    '{"a": tru}',
+    '{"a": "b"} trailing',
+    '{1: "b"}',
+])
+def test_corrupt_files_raise(tmp_path, small_chunks, text):
+    path = str(tmp_path / "pending.json")
+    write_text(path, text)
+    with pytest.raises(json_store.JsonStoreError):
+        list(json_store.iter_items(path))
+
+
+def test_pretty_output_matches_json_dump(tmp_path):
+    data = {"a": "b", "nested": {"x": [1, 2]}, "u": "ü"}
+    path = str(tmp_path / "out.json")
+    json_store.write_items(path, data.items())
+    with open(path) as f:
+        assert f.read() == json.dumps(data, indent=4)
+
+    json_store.write_items(path, [])
+    with open(path) as f:
+        assert f.read() == json.dumps({}, indent=4)
+
+
+def test_compact_output(tmp_path):
+    path = str(tmp_path / "out.json")
+    json_store.write_items(path, {"a": [1, 2], "b": "c"}.items(), compact=True)
+    with open(path) as f:
+        assert f.read() == '{"a":[1,2],"b":"c"}'
+
+
+def test_update_and_delete(tmp_path):
+    path = str(tmp_path / "pending.json")
+    json_store.write_items(path, {"a": "1", "b": "2"}.items())
+
+    assert json_store.update(path, {"b": "3", "c": "4"}) == {"b": "3", "c": "4"}
+    assert dict(json_store.iter_items(path)) == {"a": "1", "b": "3", "c": "4"}
+
+    assert json_store.update(path, {}, defaults={"a": "x", "d": "5"}) == {"d": "5"}
+    assert list(json_store.iter_items(path)) == [("a", "1"), ("b", "3"), ("c", "4"), ("d", "5")]
+
+    assert json_store.delete(path, ["b", "missing"]) == {"b": "3"}
+    assert json_store.pick(path, ["a", "b", "d"]) == {"a": "1", "d": "5"}
+
+
+def test_no_op_leaves_file_untouched(tmp_path):
+    path = str(tmp_path / "pending.json")
+    json_store.write_items(path, {"a": "1"}.items())
+    inode = os.stat(path).st_ino
+
+    assert json_store.update(path, {"a": "1"}) == {}
+    assert json_store.update(path, {}, defaults={"a": "2"}) == {}
+    assert json_store.delete(path, ["missing"]) == {}
+    assert os.stat(path).st_ino == inode
+
+
+def test_corrupt_file_is_not_overwritten(tmp_path):
+    path = str(tmp_path / "pending.json")
+    write_text(path, '{"a": "b", "c": ')
+
+    with pytest.raises(json_store.JsonStoreError):
+        json_store.update(path, {"x": "y"})
+    with open(path) as f:
+        assert f.read() == '{"a": "b", "c": '
+    assert [p for p in os.listdir(tmp_path) if p.endswith(".tmp")] == []
+
+
+def test_rewrite_keeps_file_mode(tmp_path):
+    path = str(tmp_path / "pending.json")
+    write_text(path, "{}")
+    os.chmod(path, 0o664)
+
+    json_store.update(path, {"a": "b"})
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o664
+
+
+def test_changes_win_over_defaults(tmp_path):
+    path = str(tmp_path / "pending.json")
+    json_store.write_items(path, {"a": "1"}.items())
+    assert json_store.update(path, {"b": "2"}, defaults={"a": "x", "b": "y", "c": "3"}) == {"b": "2", "c": "3"}
+    assert list(json_store.iter_items(path)) == [("a", "1"), ("b", "2"), ("c", "3")]
+
+
+def test_check(tmp_path):
+    path = str(tmp_path / "pending.json")
+    write_text(path, '{"a": "b", "c": "d", "e": }')
+    with pytest.raises(json_store.JsonStoreError):
+        json_store.check(path)
+    write_text(path, '{"a": "b"}')
+    json_store.check(path)
+
+
+def _update_in_child(path, prefix, count):
+    for i in range(count):
+        json_store.update(path, {f"{prefix}{i}": "x"})
+
+
+def test_concurrent_processes_keep_all_entries(tmp_path):
+    path = str(tmp_path / "pending.json")
+    json_store.write_items(path, [])
+    ctx = multiprocessing.get_context("fork")
+    workers = [ctx.Process(target=_update_in_child, args=(path, p, 25)) for p in "abcd"]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    assert len(dict(json_store.iter_items(path))) == 100
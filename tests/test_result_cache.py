@@ -0,0 +1,64 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.services.result_cache import ResultCache
+
+
+def test_concurrent_callers_share_one_computation():
+    cache = ResultCache()
+    calls = []
+    release = threading.Event()
+
+    def compute():
+        calls.append(1)
+        release.wait(5)
+        return "name"
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(cache.get_or_compute, "key", compute) for _ in range(4)]
+        # Let every caller start before the computation finishes
+        while not all(f.running() for f in futures):
+            pass
+        release.set()
+        results = [f.result(timeout=5) for f in futures]
+
+    assert results == ["name"] * 4
+    assert len(calls) == 1
+    assert cache.get_or_compute("key", lambda: "other") == "name"
+
+
+def test_errors_reach_waiters_and_are_not_cached():
+    cache = ResultCache()
+    started = threading.Event()
+    release = threading.Event()
+
+    def fail():
+        started.set()
+        release.wait(5)
+        raise ValueError("boom")
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        owner = pool.submit(cache.get_or_compute, "key", fail)
+        started.wait(5)
+        waiter = pool.submit(cache.get_or_compute, "key", lambda: "unused")
+        while not waiter.running():
+            pass
+        release.set()
+        for future in (owner, waiter):
+            with pytest.raises(ValueError):
+                future.result(timeout=5)
+
+    assert cache.get_or_compute("key", lambda: "ok") == "ok"
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ResultCache(maxsize=2)
+    cache.get_or_compute("a", lambda: 1)
+    cache.get_or_compute("b", lambda: 2)
+    cache.get_or_compute("a", lambda: None)
+    cache.get_or_compute("c", lambda: 3)
+
+    assert cache.get_or_compute("a", lambda: "recomputed") == 1
+    assert cache.get_or_compute("b", lambda: "recomputed") == "recomputed"
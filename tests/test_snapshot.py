@@ -0,0 +1,123 @@
+import json
+import os
+import shutil
+import stat
+
+from app.services.snapshot import compile_snapshot, open_snapshot, refresh_snapshot, snapshot_path
+
+
+def write_json(path, data):
+    with open(path, "w") as f:
+        json.dump(data, f, indent=4)
+
+
+def bump_mtime(path, seconds):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + seconds * 1_000_000_000))
+
+
+def test_round_trip_keeps_values_and_source_order(tmp_path):
+    path = str(tmp_path / "abbreviation.json")
+    data = {"zeta": "Zt", "Alpha": "Alp", "über": "Ubr", "mid": "Md"}
+    write_json(path, data)
+
+    compile_snapshot(path)
+    snap = open_snapshot(path)
+
+    assert list(snap) == list(data)
+    assert dict(snap) == data
+    assert snap["Alpha"] == "Alp"
+    assert "alpha" not in snap
+    assert snap.get("missing") is None
+    assert 42 not in snap
+
+
+def test_lowercase_keys_and_json_values(tmp_path):
+    abbr_path = str(tmp_path / "abbreviation.json")
+    write_json(abbr_path, {"Battery": "Btry"})
+    compile_snapshot(abbr_path, lowercase_keys=True)
+    assert dict(open_snapshot(abbr_path)) == {"battery": "Btry"}
+
+    rules_path = str(tmp_path / "rules.json")
+    rules = {"max": {"description": "d", "params": {"max_length": 63}}}
+    write_json(rules_path, rules)
+    compile_snapshot(rules_path, json_values=True)
+    assert open_snapshot(rules_path)["max"] == rules["max"]
+
+
+def test_empty_object(tmp_path):
+    path = str(tmp_path / "empty.json")
+    write_json(path, {})
+    compile_snapshot(path)
+    snap = open_snapshot(path)
+    assert len(snap) == 0
+    assert "x" not in snap
+
+
+def test_snapshot_keeps_source_mode(tmp_path):
+    path = str(tmp_path / "modules.json")
+    write_json(path, {"a": "b"})
+    os.chmod(path, 0o644)
+    compile_snapshot(path)
+    assert stat.S_IMODE(os.stat(snapshot_path(path)).st_mode) == 0o644
+    assert [p for p in os.listdir(tmp_path) if p.endswith(".tmp")] == []
+
+
+def test_missing_snapshot_returns_none(tmp_path):
+    path = str(tmp_path / "modules.json")
+    write_json(path, {"a": "b"})
+    assert open_snapshot(path) is None
+
+
+def test_stale_snapshot_returns_none_until_refreshed(tmp_path):
+    path = str(tmp_path / "modules.json")
+    write_json(path, {"a": "b"})
+    compile_snapshot(path)
+
+    write_json(path, {"a": "c"})
+    assert open_snapshot(path) is None
+
+    refresh_snapshot(path)
+    assert dict(open_snapshot(path)) == {"a": "c"}
+
+
+def test_source_replaced_with_older_mtime_is_stale(tmp_path):
+    path = str(tmp_path / "modules.json")
+    write_json(path, {"Charge": "Chrg"})
+    compile_snapshot(path)
+
+    # Like cp -p / rsync -a: new content, but an mtime older than the snapshot
+    replacement = str(tmp_path / "deploy.json")
+    write_json(replacement, {"Charge": "NEWCHG"})
+    bump_mtime(replacement, -60)
+    shutil.copy2(replacement, path)
+
+    assert open_snapshot(path) is None
+    refresh_snapshot(path)
+    assert open_snapshot(path)["Charge"] == "NEWCHG"
+
+
+def test_unreadable_snapshot_returns_none(tmp_path):
+    path = str(tmp_path / "modules.json")
+    write_json(path, {"a": "b"})
+    with open(snapshot_path(path), "wb") as f:
+        f.write(b"junk")
+    assert open_snapshot(path) is None
+
+
+def test_missing_source_returns_none(tmp_path):
+    path = str(tmp_path / "abbreviation.json")
+    write_json(path, {"a": "b"})
+    compile_snapshot(path)
+    os.remove(path)
+
+    assert open_snapshot(path) is None
+    refresh_snapshot(path)  # nothing to compile from; must not raise
+    assert open_snapshot(path) is None
+
+
+def test_refresh_without_existing_snapshot_does_nothing(tmp_path):
+    path = str(tmp_path / "modules.json")
+    write_json(path, {"a": "b"})
+    refresh_snapshot(path)
+    assert not os.path.exists(snapshot_path(path))
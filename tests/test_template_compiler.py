@@ -0,0 +1,33 @@
+import pytest
+
+from app.services.template_compiler import CompiledTemplate, NameLengthError
+
+TEMPLATE = "{data_type}{data_size}{module}_{unit}_{description}"
+FIELDS = ["module", "data_type", "data_size", "unit", "description"]
+MAPPINGS = {"module": {"Charge": "Chrg"}}
+USER_DATA = {"module": "Charge", "data_type": "x", "data_size": "y", "unit": "z"}
+
+
+def test_render_resolves_mapped_fields():
+    compiled = CompiledTemplate(TEMPLATE, FIELDS, MAPPINGS)
+    assert compiled.render(USER_DATA, ["Btry", "Tmpr"]) == "xyChrg_z_BtryTmpr"
+
+
+def test_length_budget_shortens_longest_tokens_first():
+    compiled = CompiledTemplate(TEMPLATE, FIELDS, MAPPINGS)
+    name = compiled.render(USER_DATA, ["SoC", "Btry", "Tmpr"], max_length=15)
+    assert name == "xyChrg_z_SoBtTm"
+    assert len(name) <= 15
+
+
+def test_length_budget_too_small_for_fixed_fields_raises():
+    compiled = CompiledTemplate(TEMPLATE, FIELDS, MAPPINGS)
+    with pytest.raises(NameLengthError):
+        compiled.render(USER_DATA, ["Btry"], max_length=9)
+    with pytest.raises(NameLengthError):
+        compiled.render(USER_DATA, [], max_length=5)
+
+
+def test_length_budget_allows_exact_fit():
+    compiled = CompiledTemplate(TEMPLATE, FIELDS, MAPPINGS)
+    assert compiled.render(USER_DATA, ["Btry"], max_length=10) == "xyChrg_z_B"